@@ -10,18 +10,158 @@ All data is synthetic and HIPAA-compliant.
 import pandas as pd
 import numpy as np
 from faker import Faker
-from datetime import datetime, timedelta
+import copy
+import io
 import json
-import random
 import uuid
+from typing import Dict
 import psycopg2
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text, Date
 import logging
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numexpr as ne
+except ImportError:  # NumExpr is optional; fall back to plain NumPy
+    ne = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:  # PyArrow is optional; fall back to DataFrame.to_csv
+    pa = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to vectorized NumPy
+    njit = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _json_dumps(obj) -> str:
+    """Serialize to a JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'))  # match orjson's compact output
+
+def _prefixed_ids(prefix: str, numbers: np.ndarray, width: int) -> np.ndarray:
+    """Build zero-padded IDs such as RAD007 from an integer array, in one array operation"""
+    if numbers.size == 0:  # np.char.zfill cannot size an empty array
+        return np.array([], dtype=str)
+    return np.char.add(prefix, np.char.zfill(numbers.astype(str), width))
+
+def _sequential_ids(prefix: str, count: int, width: int = 8) -> np.ndarray:
+    """Build zero-padded sequential IDs, e.g. ENC00000001"""
+    return _prefixed_ids(prefix, np.arange(1, count + 1), width)
+
+# Sampling interval per lab value regime, as (start, end) = coefficients . (low, high):
+# 0 = normal [lo, hi], 1 = below normal [lo/2, lo], 2 = above normal [hi, 1.5 hi]
+_LAB_REGIME_BOUNDS = np.array([
+    # start_lo, start_hi, end_lo, end_hi
+    [1.0, 0.0, 0.0, 1.0],
+    [0.5, 0.0, 1.0, 0.0],
+    [0.0, 1.0, 0.0, 1.5]
+])
+
+if njit is not None:
+    @njit(cache=True)
+    def _gen_lab_values(test_idx, lows, highs, regimes, u):
+        """Scale pre-drawn uniforms into each row's sampling interval"""
+        values = np.empty(test_idx.size)
+        for i in range(test_idx.size):
+            lo = lows[test_idx[i]]
+            hi = highs[test_idx[i]]
+            c = _LAB_REGIME_BOUNDS[regimes[i]]
+            start = c[0] * lo + c[1] * hi
+            end = c[2] * lo + c[3] * hi
+            values[i] = start + (end - start) * u[i]
+        return values
+else:
+    def _gen_lab_values(test_idx, lows, highs, regimes, u):
+        """Scale pre-drawn uniforms into each row's sampling interval"""
+        lo = lows[test_idx]
+        hi = highs[test_idx]
+        c = _LAB_REGIME_BOUNDS[regimes]
+        start = c[:, 0] * lo + c[:, 1] * hi
+        end = c[:, 2] * lo + c[:, 3] * hi
+        return start + (end - start) * u
+
+_VITAL_SIGN_COLUMNS = [
+    'blood_pressure_systolic', 'blood_pressure_diastolic', 'heart_rate', 'temperature', 'oxygen_saturation'
+]
+_RAW_DATA_COLUMNS = [
+    'diagnosis_codes', 'procedure_codes', 'length_of_stay_hours', 'total_cost', *_VITAL_SIGN_COLUMNS, 'complications'
+]
+
+# Date-only columns; pandas would create them as TIMESTAMP (or TEXT on an empty frame)
+_DATE_COLUMNS = ['date_of_birth', 'start_date', 'end_date']
+
+# Tables in a generated dataset that belong to the silver layer; everything else is bronze.
+# Silver tables carry keys, constraints, triggers and dependents, so they are reloaded, not replaced.
+_SILVER_TABLES = {'patients'}
+
+def _pack_raw_data(df: pd.DataFrame) -> pd.DataFrame:
+    """Collapse flattened encounter columns into the bronze raw_data JSON column"""
+    if not set(_RAW_DATA_COLUMNS).issubset(df.columns):
+        return df
+    
+    columns = {col: df[col].tolist() for col in _RAW_DATA_COLUMNS}
+    raw_data = [
+        _json_dumps({
+            'diagnosis_codes': dx,
+            'procedure_codes': pc,
+            'length_of_stay_hours': los,
+            'total_cost': cost,
+            'vital_signs': dict(zip(_VITAL_SIGN_COLUMNS, vitals)),
+            'complications': comp
+        })
+        for dx, pc, los, cost, *vitals, comp in zip(*columns.values())
+    ]
+    
+    packed = df.drop(columns=_RAW_DATA_COLUMNS)
+    packed['raw_data'] = raw_data
+    return packed
+
+def _sample_without_replacement(rng: np.random.Generator, pool, sizes: np.ndarray) -> list:
+    """Draw one sample without replacement from pool per entry of sizes, as lists"""
+    pool = np.asarray(pool)
+    # The k smallest of a row of uniform keys are a uniformly random k-subset
+    keys = rng.random((len(sizes), len(pool)))
+    samples = [None] * len(sizes)
+    
+    # Iterate only over the few distinct sample sizes
+    for k in np.unique(sizes):
+        rows = np.flatnonzero(sizes == k)
+        if k == 0:
+            picks = [[] for _ in rows]
+        else:
+            picks = pool[np.argpartition(keys[rows], k - 1, axis=1)[:, :k]].tolist()
+        for row, pick in zip(rows.tolist(), picks):
+            samples[row] = pick
+    return samples
+
+def _categorize(df: pd.DataFrame, columns) -> pd.DataFrame:
+    """Store low-cardinality string columns as pandas Categoricals"""
+    df[columns] = df[columns].astype('category')
+    return df
+
+def _sql_dtypes(df: pd.DataFrame) -> Dict:
+    """SQL column types to_sql cannot infer from the DataFrame"""
+    return {col: Date for col in _DATE_COLUMNS if col in df.columns}
+
+def _run_seeded(generator, method_name: str, encounters_df: pd.DataFrame, seed: int) -> pd.DataFrame:
+    """Run an encounter-derived generator with its own RNG seed (picklable for worker processes)"""
+    worker = copy.copy(generator)
+    worker.rng = np.random.default_rng(seed)
+    return getattr(worker, method_name)(encounters_df)
+
 class HealthcareSyntheticDataGenerator:
     """Generate synthetic healthcare data for testing"""
     
@@ -29,8 +169,7 @@ class HealthcareSyntheticDataGenerator:
         """Initialize generator with random seed for reproducibility"""
         self.fake = Faker()
         Faker.seed(seed)
-        np.random.seed(seed)
-        random.seed(seed)
+        self.rng = np.random.default_rng(seed)
         
         # Medical data lists
         self.diagnosis_codes = [
@@ -75,100 +214,121 @@ class HealthcareSyntheticDataGenerator:
             ('PROV006', 'Dr. Reddy', 'Nephrology', 'FAC004', 14),
             ('PROV007', 'Dr. Joshi', 'Psychiatry', 'FAC005', 20)
         ]
+        
+        # Pre-generated Faker pools, sampled in bulk instead of calling Faker per row
+        self._zipcode_pool = np.array([self.fake.zipcode() for _ in range(1000)])
+        self._address_pool = np.array([self.fake.street_address() for _ in range(1000)])
     
     def generate_patients(self, num_patients: int = 1000) -> pd.DataFrame:
         """Generate synthetic patient data"""
         logger.info(f"Generating {num_patients} synthetic patients")
         
-        patients = []
-        for i in range(num_patients):
-            patient = {
-                'patient_id': f'PAT{str(i+1).zfill(6)}',
-                'medical_record_number': f'MRN{str(i+1).zfill(6)}',
-                'date_of_birth': self.fake.date_of_birth(minimum_age=18, maximum_age=95),
-                'gender': random.choice(['M', 'F']),
-                'race': random.choice(['Asian', 'White', 'Black', 'Hispanic', 'Other']),
-                'ethnicity': random.choice(['Hispanic', 'Non-Hispanic']),
-                'primary_language': random.choice(['English', 'Hindi', 'Tamil', 'Telugu', 'Bengali']),
-                'insurance_type': random.choice(['Private', 'Government', 'Self-Pay', 'Medicare']),
-                'zip_code': self.fake.zipcode()
-            }
-            patients.append(patient)
-        
-        return pd.DataFrame(patients)
+        # Each column is drawn in a single vectorized call
+        # Date of birth uniformly within an 18-95 year age window
+        today = np.datetime64('today', 'D')
+        oldest = (today - np.timedelta64(95 * 365, 'D')).astype(np.int64)
+        youngest = (today - np.timedelta64(18 * 365, 'D')).astype(np.int64)
+        dob_days = self.rng.integers(oldest, youngest + 1, num_patients)
+        
+        patients = pd.DataFrame({
+            'patient_id': _sequential_ids('PAT', num_patients, 6),
+            'medical_record_number': _sequential_ids('MRN', num_patients, 6),
+            'date_of_birth': dob_days.astype('datetime64[D]'),
+            'gender': self.rng.choice(['M', 'F'], num_patients),
+            'race': self.rng.choice(['Asian', 'White', 'Black', 'Hispanic', 'Other'], num_patients),
+            'ethnicity': self.rng.choice(['Hispanic', 'Non-Hispanic'], num_patients),
+            'primary_language': self.rng.choice(['English', 'Hindi', 'Tamil', 'Telugu', 'Bengali'], num_patients),
+            'insurance_type': self.rng.choice(['Private', 'Government', 'Self-Pay', 'Medicare'], num_patients),
+            'zip_code': self.rng.choice(self._zipcode_pool, num_patients)
+        }, copy=False)
+        
+        return _categorize(patients, ['gender', 'race', 'ethnicity', 'primary_language', 'insurance_type'])
     
     def generate_encounters(self, patients_df: pd.DataFrame, encounters_per_patient: int = 3) -> pd.DataFrame:
         """Generate synthetic patient encounters"""
         logger.info(f"Generating encounters for {len(patients_df)} patients")
         
-        encounters = []
-        encounter_types = ['EM', 'IP', 'OP', 'OB', 'AMB']
-        
-        for _, patient in patients_df.iterrows():
-            num_encounters = np.random.poisson(encounters_per_patient)
-            
-            for j in range(max(1, num_encounters)):  # At least 1 encounter per patient
-                # Generate encounter date (within last 2 years)
-                encounter_date = self.fake.date_time_between(
-                    start_date='-2y', 
-                    end_date='now'
-                )
-                
-                # Select random facility and provider
-                facility = random.choice(self.facilities)
-                provider = random.choice(self.providers)
-                
-                # Generate length of stay based on encounter type
-                encounter_type = random.choice(encounter_types)
-                if encounter_type == 'IP':  # Inpatient
-                    los_hours = np.random.gamma(2, 24)  # Average 2 days
-                elif encounter_type == 'EM':  # Emergency
-                    los_hours = np.random.exponential(4)  # Average 4 hours
-                else:  # Outpatient
-                    los_hours = np.random.uniform(0.5, 3)  # 30 min to 3 hours
-                
-                # Generate costs based on encounter type and LOS
-                base_cost = {
-                    'IP': 5000, 'EM': 1500, 'OP': 300, 'OB': 2000, 'AMB': 250
-                }
-                cost_multiplier = 1 + (los_hours / 24) * 0.5  # Cost increases with LOS
-                total_cost = base_cost[encounter_type] * cost_multiplier * random.uniform(0.7, 1.8)
-                
-                # Select diagnoses and procedures
-                primary_diagnosis = random.choice(self.diagnosis_codes)
-                num_procedures = np.random.poisson(2) + 1
-                procedure_codes = random.sample(self.procedure_codes, min(num_procedures, len(self.procedure_codes)))
-                
-                # Create raw data JSON
-                raw_data = {
-                    'diagnosis_codes': [primary_diagnosis] + random.sample(self.diagnosis_codes, random.randint(0, 2)),
-                    'procedure_codes': procedure_codes,
-                    'length_of_stay_hours': round(los_hours, 1),
-                    'total_cost': round(total_cost, 2),
-                    'vital_signs': {
-                        'blood_pressure_systolic': random.randint(90, 180),
-                        'blood_pressure_diastolic': random.randint(60, 120),
-                        'heart_rate': random.randint(60, 120),
-                        'temperature': round(random.uniform(96.5, 102.0), 1),
-                        'oxygen_saturation': random.randint(92, 100)
-                    },
-                    'complications': random.choice([[], ['Infection'], ['Bleeding'], ['Drug Reaction']])
-                }
-                
-                encounter = {
-                    'encounter_id': f'ENC{str(len(encounters) + 1).zfill(8)}',
-                    'patient_id': patient['patient_id'],
-                    'encounter_date': encounter_date,
-                    'encounter_type': encounter_type,
-                    'facility_id': facility[0],
-                    'provider_id': provider[0],
-                    'admission_source': random.choice(['Emergency', 'Physician Referral', 'Transfer', 'Direct']),
-                    'discharge_disposition': random.choice(['Home', 'Transfer', 'Skilled Nursing', 'Rehab']),
-                    'raw_data': json.dumps(raw_data)
-                }
-                encounters.append(encounter)
-        
-        return pd.DataFrame(encounters)
+        encounter_types = np.array(['EM', 'IP', 'OP', 'OB', 'AMB'])
+        base_cost = np.array([1500, 5000, 300, 2000, 250])  # Aligned with encounter_types
+        complication_choices = [[], ['Infection'], ['Bleeding'], ['Drug Reaction']]
+        
+        # At least 1 encounter per patient
+        counts = np.maximum(1, self.rng.poisson(encounters_per_patient, len(patients_df)))
+        num_encounters = int(counts.sum())
+        patient_ids = np.repeat(patients_df['patient_id'].to_numpy(), counts)
+        
+        # Draw all per-encounter random values up front
+        type_codes = self.rng.integers(0, len(encounter_types), num_encounters)
+        etypes = encounter_types[type_codes]
+        fac_idx = self.rng.integers(0, len(self.facilities), num_encounters)
+        prov_idx = self.rng.integers(0, len(self.providers), num_encounters)
+        cost_rand = self.rng.uniform(0.7, 1.8, num_encounters)
+        primary_dx_idx = self.rng.integers(0, len(self.diagnosis_codes), num_encounters)
+        num_procedures = np.minimum(self.rng.poisson(2, num_encounters) + 1, len(self.procedure_codes))
+        num_secondary_dx = self.rng.integers(0, 3, num_encounters)
+        bp_systolic = self.rng.integers(90, 181, num_encounters)
+        bp_diastolic = self.rng.integers(60, 121, num_encounters)
+        heart_rate = self.rng.integers(60, 121, num_encounters)
+        temperature = self.rng.uniform(96.5, 102.0, num_encounters).round(1)
+        oxygen_saturation = self.rng.integers(92, 101, num_encounters)
+        complication_idx = self.rng.integers(0, len(complication_choices), num_encounters)
+        
+        # Generate length of stay based on encounter type
+        los_hours = self.rng.uniform(0.5, 3, num_encounters)  # Outpatient: 30 min to 3 hours
+        inpatient = etypes == 'IP'
+        los_hours[inpatient] = self.rng.gamma(2, 24, inpatient.sum())  # Average 2 days
+        emergency = etypes == 'EM'
+        los_hours[emergency] = self.rng.exponential(4, emergency.sum())  # Average 4 hours
+        
+        # Generate costs based on encounter type and LOS (cost increases with LOS)
+        base = np.take(base_cost, type_codes)
+        if ne is not None:
+            total_cost = ne.evaluate('base * (1 + los_hours / 24 * 0.5) * cost_rand')
+        else:
+            total_cost = base * (1 + los_hours / 24 * 0.5) * cost_rand
+        total_cost = np.round(total_cost, 2)
+        
+        # Generate encounter dates (within last 2 years), anchored to naive local time like Faker
+        end = pd.Timestamp.now().to_datetime64().astype('datetime64[s]')
+        start = end - np.timedelta64(2 * 365, 'D')
+        span_seconds = int((end - start) / np.timedelta64(1, 's'))
+        encounter_dates = start + self.rng.integers(0, span_seconds, num_encounters).astype('timedelta64[s]')
+        
+        # Select diagnoses and procedures
+        primary_diagnoses = np.asarray(self.diagnosis_codes)[primary_dx_idx].tolist()
+        secondary_diagnoses = _sample_without_replacement(self.rng, self.diagnosis_codes, num_secondary_dx)
+        diagnosis_codes = [[dx] + rest for dx, rest in zip(primary_diagnoses, secondary_diagnoses)]
+        procedure_codes = _sample_without_replacement(self.rng, self.procedure_codes, num_procedures)
+        
+        facility_ids = np.array([f[0] for f in self.facilities])
+        provider_ids = np.array([p[0] for p in self.providers])
+        
+        encounters_df = pd.DataFrame({
+            'encounter_id': _sequential_ids('ENC', num_encounters),
+            'patient_id': patient_ids,
+            'encounter_date': encounter_dates,
+            'encounter_type': etypes,
+            'facility_id': facility_ids[fac_idx],
+            'provider_id': provider_ids[prov_idx],
+            'admission_source': self.rng.choice(['Emergency', 'Physician Referral', 'Transfer', 'Direct'], num_encounters),
+            'discharge_disposition': self.rng.choice(['Home', 'Transfer', 'Skilled Nursing', 'Rehab'], num_encounters),
+            # Clinical details are kept as columns; _pack_raw_data builds the raw_data JSON
+            # only where a text format needs it
+            'diagnosis_codes': diagnosis_codes,
+            'procedure_codes': procedure_codes,
+            'length_of_stay_hours': los_hours.round(1),
+            'total_cost': total_cost,
+            'blood_pressure_systolic': bp_systolic,
+            'blood_pressure_diastolic': bp_diastolic,
+            'heart_rate': heart_rate,
+            'temperature': temperature,
+            'oxygen_saturation': oxygen_saturation,
+            'complications': [complication_choices[k] for k in complication_idx]
+        }, copy=False)
+        
+        return _categorize(encounters_df, [
+            'encounter_type', 'facility_id', 'provider_id', 'admission_source', 'discharge_disposition'
+        ])
     
     def generate_lab_results(self, encounters_df: pd.DataFrame) -> pd.DataFrame:
         """Generate synthetic laboratory results"""
@@ -184,38 +344,39 @@ class HealthcareSyntheticDataGenerator:
             ('Creatinine', 'Serum Creatinine', 'mg/dL', 0.6, 1.2)
         ]
         
-        lab_results = []
-        
-        for _, encounter in encounters_df.iterrows():
-            # Generate 1-5 lab tests per encounter
-            num_tests = np.random.poisson(2) + 1
-            
-            for _ in range(num_tests):
-                test = random.choice(lab_tests)
-                
-                # Generate realistic test values
-                if random.random() < 0.8:  # 80% normal results
-                    result_value = round(random.uniform(test[3], test[4]), 2)
-                else:  # 20% abnormal results
-                    if random.random() < 0.5:
-                        result_value = round(random.uniform(test[3] * 0.5, test[3]), 2)  # Below normal
-                    else:
-                        result_value = round(random.uniform(test[4], test[4] * 1.5), 2)  # Above normal
-                
-                lab_result = {
-                    'lab_result_id': f'LAB{str(len(lab_results) + 1).zfill(8)}',
-                    'patient_id': encounter['patient_id'],
-                    'encounter_id': encounter['encounter_id'],
-                    'test_code': test[0],
-                    'test_name': test[1],
-                    'result_value': str(result_value),
-                    'reference_range': f'{test[3]}-{test[4]} {test[2]}',
-                    'result_date': encounter['encounter_date'] + timedelta(hours=random.randint(1, 24)),
-                    'lab_facility': random.choice(['Central Lab', 'Point of Care', 'Reference Lab'])
-                }
-                lab_results.append(lab_result)
-        
-        return pd.DataFrame(lab_results)
+        test_codes = np.array([t[0] for t in lab_tests])
+        test_names = np.array([t[1] for t in lab_tests])
+        reference_ranges = np.array([f'{t[3]}-{t[4]} {t[2]}' for t in lab_tests])
+        lows = np.array([t[3] for t in lab_tests], dtype=float)
+        highs = np.array([t[4] for t in lab_tests], dtype=float)
+        
+        # Generate 1-5 lab tests per encounter
+        num_tests = self.rng.poisson(2, len(encounters_df)) + 1
+        num_results = int(num_tests.sum())
+        encounter_dates = np.repeat(encounters_df['encounter_date'].to_numpy(), num_tests)
+        
+        test_idx = self.rng.integers(0, len(lab_tests), num_results)
+        
+        # Generate realistic test values: 80% normal, 10% below normal, 10% above normal
+        regime = self.rng.choice(3, num_results, p=[0.8, 0.1, 0.1])
+        u = self.rng.random(num_results)
+        result_values = np.round(_gen_lab_values(test_idx, lows, highs, regime, u), 2)
+        
+        result_offsets = self.rng.integers(1, 25, num_results).astype('timedelta64[h]')
+        
+        lab_results_df = pd.DataFrame({
+            'lab_result_id': _sequential_ids('LAB', num_results),
+            'patient_id': np.repeat(encounters_df['patient_id'].to_numpy(), num_tests),
+            'encounter_id': np.repeat(encounters_df['encounter_id'].to_numpy(), num_tests),
+            'test_code': test_codes[test_idx],
+            'test_name': test_names[test_idx],
+            'result_value': result_values.astype(str),
+            'reference_range': reference_ranges[test_idx],
+            'result_date': encounter_dates + result_offsets,
+            'lab_facility': self.rng.choice(['Central Lab', 'Point of Care', 'Reference Lab'], num_results)
+        }, copy=False)
+        
+        return _categorize(lab_results_df, ['test_code', 'test_name', 'reference_range', 'lab_facility'])
     
     def generate_imaging_studies(self, encounters_df: pd.DataFrame) -> pd.DataFrame:
         """Generate synthetic imaging studies"""
@@ -249,27 +410,28 @@ class HealthcareSyntheticDataGenerator:
             'Acute findings requiring immediate attention'
         ]
         
-        imaging_studies = []
+        modality_codes = np.array([m[0] for m in imaging_modalities])
         
         # Generate imaging for ~40% of encounters
-        imaging_encounters = encounters_df.sample(frac=0.4)
-        
-        for _, encounter in imaging_encounters.iterrows():
-            modality = random.choice(imaging_modalities)
-            
-            imaging_study = {
-                'study_id': f'IMG{str(len(imaging_studies) + 1).zfill(8)}',
-                'patient_id': encounter['patient_id'],
-                'encounter_id': encounter['encounter_id'],
-                'modality': modality[0],
-                'study_description': random.choice(study_descriptions),
-                'study_date': encounter['encounter_date'] + timedelta(hours=random.randint(0, 48)),
-                'radiologist_id': f'RAD{random.randint(1, 10):03d}',
-                'findings': random.choice(findings_templates)
-            }
-            imaging_studies.append(imaging_study)
-        
-        return pd.DataFrame(imaging_studies)
+        idx = np.flatnonzero(self.rng.random(len(encounters_df)) < 0.4)
+        num_studies = idx.size
+        
+        encounter_dates = encounters_df['encounter_date'].to_numpy()[idx]
+        hour_offsets = self.rng.integers(0, 49, num_studies).astype('timedelta64[h]')
+        radiologist_nums = self.rng.integers(1, 11, num_studies)
+        
+        imaging_studies_df = pd.DataFrame({
+            'study_id': _sequential_ids('IMG', num_studies),
+            'patient_id': encounters_df['patient_id'].to_numpy()[idx],
+            'encounter_id': encounters_df['encounter_id'].to_numpy()[idx],
+            'modality': modality_codes[self.rng.integers(0, len(imaging_modalities), num_studies)],
+            'study_description': self.rng.choice(study_descriptions, num_studies),
+            'study_date': encounter_dates + hour_offsets,
+            'radiologist_id': _prefixed_ids('RAD', radiologist_nums, 3),
+            'findings': self.rng.choice(findings_templates, num_studies)
+        }, copy=False)
+        
+        return _categorize(imaging_studies_df, ['modality', 'study_description', 'radiologist_id', 'findings'])
     
     def generate_medications(self, encounters_df: pd.DataFrame) -> pd.DataFrame:
         """Generate synthetic medication data"""
@@ -278,67 +440,99 @@ class HealthcareSyntheticDataGenerator:
         dosages = ['5mg', '10mg', '25mg', '50mg', '100mg', '250mg', '500mg']
         frequencies = ['Once daily', 'Twice daily', 'Three times daily', 'As needed', 'Every 8 hours']
         
-        medications = []
-        
-        for _, encounter in encounters_df.iterrows():
-            # Generate 1-4 medications per encounter
-            num_meds = np.random.poisson(2) + 1
-            
-            for _ in range(num_meds):
-                start_date = encounter['encounter_date'].date()
-                duration_days = random.randint(7, 90)  # 1 week to 3 months
-                
-                medication = {
-                    'medication_id': f'MED{str(len(medications) + 1).zfill(8)}',
-                    'patient_id': encounter['patient_id'],
-                    'encounter_id': encounter['encounter_id'],
-                    'medication_name': random.choice(self.medications),
-                    'dosage': random.choice(dosages),
-                    'frequency': random.choice(frequencies),
-                    'start_date': start_date,
-                    'end_date': start_date + timedelta(days=duration_days),
-                    'prescriber_id': encounter['provider_id']
-                }
-                medications.append(medication)
-        
-        return pd.DataFrame(medications)
+        # Generate 1-4 medications per encounter
+        num_meds = self.rng.poisson(2, len(encounters_df)) + 1
+        num_medications = int(num_meds.sum())
+        
+        # Courses start on the encounter day and last 1 week to 3 months
+        start_dates = np.repeat(encounters_df['encounter_date'].to_numpy(), num_meds).astype('datetime64[D]')
+        durations = self.rng.integers(7, 91, num_medications).astype('timedelta64[D]')
+        
+        medications_df = pd.DataFrame({
+            'medication_id': _sequential_ids('MED', num_medications),
+            'patient_id': np.repeat(encounters_df['patient_id'].to_numpy(), num_meds),
+            'encounter_id': np.repeat(encounters_df['encounter_id'].to_numpy(), num_meds),
+            'medication_name': self.rng.choice(self.medications, num_medications),
+            'dosage': self.rng.choice(dosages, num_medications),
+            'frequency': self.rng.choice(frequencies, num_medications),
+            'start_date': start_dates,
+            'end_date': start_dates + durations,
+            'prescriber_id': np.repeat(encounters_df['provider_id'].to_numpy(), num_meds)
+        }, copy=False)
+        
+        return _categorize(medications_df, ['medication_name', 'dosage', 'frequency', 'prescriber_id'])
+    
+    def _copy_to_table(self, engine, df: pd.DataFrame, table_name: str, schema: str,
+                       replace_table: bool = True):
+        """Bulk load a DataFrame into PostgreSQL using COPY FROM STDIN"""
+        # Prepare the table and stream the rows in one transaction, so a failed COPY
+        # rolls back to the previous table
+        buffer = io.StringIO()
+        df.to_csv(buffer, index=False, header=False)
+        buffer.seek(0)
+        
+        columns = ', '.join(f'"{col}"' for col in df.columns)
+        with engine.begin() as conn:
+            if not replace_table and inspect(conn).has_table(table_name, schema=schema):
+                # Empty the existing table (and rows that reference it) but keep its definition
+                conn.execute(text(f'TRUNCATE {schema}.{table_name} CASCADE'))
+            else:
+                df.head(0).to_sql(table_name, conn, schema=schema, if_exists='replace', index=False,
+                                  dtype=_sql_dtypes(df))
+            with conn.connection.cursor() as cursor:
+                cursor.copy_expert(
+                    f'COPY {schema}.{table_name} ({columns}) FROM STDIN WITH CSV',
+                    buffer
+                )
     
     def save_to_database(self, engine, data_dict: Dict[str, pd.DataFrame]):
         """Save all generated data to database"""
         logger.info("Saving synthetic data to database")
         
         try:
-            # Save to bronze layer
+            # Save generated tables to their layer (COPY on PostgreSQL, INSERTs elsewhere)
             for table_name, df in data_dict.items():
-                df.to_sql(
-                    table_name, 
-                    engine, 
-                    schema='bronze',
-                    if_exists='replace',
-                    index=False,
-                    chunksize=1000
-                )
-                logger.info(f"Saved {len(df)} records to bronze.{table_name}")
+                schema = 'silver' if table_name in _SILVER_TABLES else 'bronze'
+                replace_table = table_name not in _SILVER_TABLES
+                df = _pack_raw_data(df)
+                if engine.dialect.name == 'postgresql':
+                    self._copy_to_table(engine, df, table_name, schema=schema, replace_table=replace_table)
+                else:
+                    with engine.begin() as conn:
+                        if not replace_table and inspect(conn).has_table(table_name, schema=schema):
+                            conn.execute(text(f'DELETE FROM {schema}.{table_name}'))
+                        # Multi-row INSERTs, keeping rows * columns under the 32767 bind-parameter limit
+                        df.to_sql(
+                            table_name, 
+                            conn, 
+                            schema=schema,
+                            if_exists='replace' if replace_table else 'append',
+                            index=False,
+                            method='multi',
+                            chunksize=min(5000, 32767 // len(df.columns)),
+                            dtype=_sql_dtypes(df)
+                        )
+                logger.info(f"Saved {len(df)} records to {schema}.{table_name}")
             
             # Save reference data to silver layer
             facilities_df = pd.DataFrame(self.facilities, columns=[
                 'facility_id', 'facility_name', 'facility_type', 'city', 'state', 'bed_count'
             ])
-            facilities_df['quality_rating'] = np.random.uniform(3.5, 5.0, len(facilities_df)).round(1)
-            facilities_df['address_line1'] = [self.fake.street_address() for _ in range(len(facilities_df))]
-            facilities_df['zip_code'] = [self.fake.zipcode() for _ in range(len(facilities_df))]
+            facilities_df['quality_rating'] = self.rng.uniform(3.5, 5.0, len(facilities_df)).round(1)
+            facilities_df['address_line1'] = self.rng.choice(self._address_pool, len(facilities_df))
+            facilities_df['zip_code'] = self.rng.choice(self._zipcode_pool, len(facilities_df))
             facilities_df['specialties'] = [
-                json.dumps(random.sample(['Cardiology', 'Emergency', 'Surgery', 'ICU', 'Pediatrics'], 
-                                       random.randint(2, 4)))
+                json.dumps(self.rng.choice(['Cardiology', 'Emergency', 'Surgery', 'ICU', 'Pediatrics'], 
+                                           self.rng.integers(2, 5), replace=False).tolist())
                 for _ in range(len(facilities_df))
             ]
             
             providers_df = pd.DataFrame(self.providers, columns=[
                 'provider_id', 'provider_name', 'specialty', 'facility_id', 'years_experience'
             ])
-            providers_df['license_number'] = [f'LIC{random.randint(100000, 999999)}' for _ in range(len(providers_df))]
-            providers_df['patient_volume_avg'] = np.random.poisson(50, len(providers_df))
-            providers_df['quality_rating'] = np.random.uniform(3.8, 5.0, len(providers_df)).round(1)
+            providers_df['license_number'] = [f'LIC{n}' for n in self.rng.integers(100000, 1000000, len(providers_df))]
+            providers_df['patient_volume_avg'] = self.rng.poisson(50, len(providers_df))
+            providers_df['quality_rating'] = self.rng.uniform(3.8, 5.0, len(providers_df)).round(1)
             
             # Save reference data
             facilities_df.to_sql('facilities', engine, schema='silver', if_exists='replace', index=False)
@@ -350,33 +544,70 @@ class HealthcareSyntheticDataGenerator:
             logger.error(f"Error saving data to database: {str(e)}")
             raise
     
-    def save_to_files(self, data_dict: Dict[str, pd.DataFrame], output_dir: str = 'data/synthetic/'):
-        """Save generated data to CSV files"""
+    def save_to_files(self, data_dict: Dict[str, pd.DataFrame], output_dir: str = 'data/synthetic/',
+                      file_format: str = 'parquet'):
+        """Save generated data to Parquet (default, requires PyArrow) or CSV files"""
         logger.info(f"Saving synthetic data to {output_dir}")
         
         import os
         os.makedirs(output_dir, exist_ok=True)
         
+        if file_format == 'parquet' and pa is None:
+            logger.warning("PyArrow is not installed, saving CSV files instead of Parquet")
+            file_format = 'csv'
+        
         for table_name, df in data_dict.items():
+            if file_format == 'parquet':
+                # Parquet keeps the encounter list columns natively, no JSON needed
+                file_path = f"{output_dir}{table_name}.parquet"
+                df.to_parquet(file_path, index=False)
+                logger.info(f"Saved {len(df)} records to {file_path}")
+                continue
+            
+            df = _pack_raw_data(df)
             file_path = f"{output_dir}{table_name}.csv"
-            df.to_csv(file_path, index=False)
+            if pa is not None:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                # Write date-only columns as dates rather than midnight timestamps
+                for col in _DATE_COLUMNS:
+                    if col in table.column_names:
+                        i = table.column_names.index(col)
+                        table = table.set_column(i, col, table[col].cast(pa.date32()))
+                pacsv.write_csv(table, file_path)
+            else:
+                df.to_csv(file_path, index=False)
             logger.info(f"Saved {len(df)} records to {file_path}")
     
-    def generate_complete_dataset(self, num_patients: int = 1000) -> Dict[str, pd.DataFrame]:
+    def generate_complete_dataset(self, num_patients: int = 1000, max_workers: int = 1) -> Dict[str, pd.DataFrame]:
         """Generate complete synthetic healthcare dataset"""
         logger.info(f"Generating complete synthetic dataset for {num_patients} patients")
         
         # Generate core data
         patients_df = self.generate_patients(num_patients)
         encounters_df = self.generate_encounters(patients_df, encounters_per_patient=3)
-        lab_results_df = self.generate_lab_results(encounters_df)
-        imaging_studies_df = self.generate_imaging_studies(encounters_df)
-        medications_df = self.generate_medications(encounters_df)
         
-        # Add patients to encounters for reference
-        patients_df.to_sql('patients', schema='silver', con=None, if_exists='replace', index=False)
+        # Lab, imaging and medication data depend only on encounters, so they can be generated
+        # in parallel. Each gets a seed drawn here so output is identical either way.
+        methods = ['generate_lab_results', 'generate_imaging_studies', 'generate_medications']
+        seeds = self.rng.integers(0, 2**31 - 1, len(methods))
+        if max_workers > 1:
+            # Only pickle the columns the generators read, not the clinical list columns
+            encounter_keys = encounters_df[['encounter_id', 'patient_id', 'encounter_date', 'provider_id']]
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_run_seeded, self, method, encounter_keys, int(seed))
+                    for method, seed in zip(methods, seeds)
+                ]
+                lab_results_df, imaging_studies_df, medications_df = [f.result() for f in futures]
+        else:
+            lab_results_df, imaging_studies_df, medications_df = [
+                _run_seeded(self, method, encounters_df, int(seed))
+                for method, seed in zip(methods, seeds)
+            ]
         
+        # Patients are saved to the silver layer by save_to_database
         data_dict = {
+            'patients': patients_df,
             'patient_encounters': encounters_df,
             'lab_results': lab_results_df,
             'imaging_studies': imaging_studies_df,
@@ -389,7 +620,6 @@ class HealthcareSyntheticDataGenerator:
         print("="*50)
         for table_name, df in data_dict.items():
             print(f"{table_name}: {len(df):,} records")
-        print(f"Total patients: {len(patients_df):,}")
         print(f"Date range: {encounters_df['encounter_date'].min()} to {encounters_df['encounter_date'].max()}")
         print("="*50)
         
@@ -414,7 +644,7 @@ def main():
         generator.save_to_files(data_dict)
         
         print("\n✅ Synthetic data generation completed successfully!")
-        print("📁 Data saved to database and CSV files in data/synthetic/")
+        print("📁 Data saved to database and Parquet files in data/synthetic/")
         print("🔄 Ready to run ETL pipeline with: python src/processing/patient_journey_etl.py")
         
     except Exception as e: